@@ -0,0 +1,33 @@
+"""
+Filesystem helpers shared by the backup and restore commands
+"""
+
+import os
+import shutil
+import subprocess
+import tempfile
+from pathlib import Path
+from typing import Union
+
+
+def remove_in_background(path: Union[str, Path]) -> None:
+    """Delete a directory tree without blocking the caller.
+
+    The tree is moved into a fresh hidden directory next to it, which is O(1), and
+    that directory is then removed by a detached ``rm -rf``, which unlike a thread
+    also survives the exit of a worker process.
+    """
+    path = Path(path)
+    rm = shutil.which('rm')
+    if rm is None:
+        shutil.rmtree(path)
+        return
+    # A unique name, an earlier rm -rf of the same tree may still be running
+    trash = Path(tempfile.mkdtemp(dir=path.parent, prefix=f".{path.name}.trash")) / path.name
+    os.rename(path, trash)
+    subprocess.Popen(
+        [rm, '-rf', str(trash.parent)],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True
+    )
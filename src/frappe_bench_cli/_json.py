@@ -0,0 +1,32 @@
+"""
+JSON helpers for bench_info files, using orjson when it is installed
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def load(path: Union[str, Path]) -> Any:
+    """Load a JSON file."""
+    if orjson is not None:
+        return orjson.loads(Path(path).read_bytes())
+    with open(path) as f:
+        return json.load(f)
+
+
+def dump(obj: Any, path: Union[str, Path], pretty: bool = True) -> None:
+    """Write obj to a JSON file, indented by 2 spaces unless pretty is False."""
+    if orjson is not None:
+        Path(path).write_bytes(orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0))
+        return
+    with open(path, 'w') as f:
+        if pretty:
+            json.dump(obj, f, indent=2)
+        else:
+            json.dump(obj, f, separators=(',', ':'))
@@ -0,0 +1,23 @@
+"""
+Shared rich console for all FBM commands
+"""
+
+import logging
+import threading
+from rich.console import Console
+from rich.logging import RichHandler
+
+console = Console()
+
+# Held while printing from worker threads so their messages do not interleave
+console_lock = threading.Lock()
+
+
+def setup_logging(level: int = logging.INFO) -> None:
+    """Send the package's log records to the shared console, leaving the root logger alone."""
+    logger = logging.getLogger('frappe_bench_cli')
+    if logger.handlers:
+        return
+    logger.addHandler(RichHandler(console=console, show_time=False, show_path=False, markup=False))
+    logger.setLevel(level)
+    logger.propagate = False
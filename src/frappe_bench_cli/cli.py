@@ -7,20 +7,18 @@ import os
 import sys
 import click
 from pathlib import Path
-from rich.console import Console
 from rich.panel import Panel
 
 from .commands.backup import backup_bench, backup_all_benches
 from .commands.restore import restore_bench
-from .commands.create import create_bench
-
-console = Console()
+from ._ui import console, setup_logging
 
 @click.group()
 @click.version_option(version="0.1.0")
 def cli():
     """FBM (Frappe Bench Manager) - Backup and restore Frappe benches with ease."""
-    pass
+    # Per-site progress from worker threads is logged through the shared console
+    setup_logging()
 
 
 @cli.group()
@@ -30,21 +28,29 @@ def backup():
 
 
 @backup.command()
-@click.argument('bench_path', type=click.Path(exists=True, file_okay=False, dir_okay=True))
+@click.argument('bench_path', type=click.Path(path_type=Path))
 @click.option('--output', '-o', type=click.Path(), help='Output directory for backup files')
 @click.option('--no-compress', is_flag=True, help='Do not compress the backup')
 @click.option('--backup-folder', '-b', type=click.Path(), help='Backup folder')
 @click.option('--exclude-files', is_flag=True, help='Exclude files from backup')
-def single(bench_path, output, no_compress, backup_folder, exclude_files):
+@click.option('--compression-level', type=click.IntRange(1, 9), default=6, help='gzip compression level (1 fastest, 9 smallest)')
+@click.option('--verbose', '-v', is_flag=True, help="Show the output of each site's bench backup")
+@click.option('--dump-compression-level', type=click.IntRange(1, 9), default=1, help='gzip level for database dumps (1 fastest, 9 smallest)')
+def single(bench_path, output, no_compress, backup_folder, exclude_files, compression_level, verbose, dump_compression_level):
     """Backup a single Frappe bench"""
+    if not bench_path.is_dir():
+        raise click.BadParameter(f"Directory '{bench_path}' does not exist.", param_hint="'BENCH_PATH'")
     try:
         output_dir = output or Path.cwd() / 'backups'
         result = backup_bench(
-            bench_path=Path(bench_path),
+            bench_path=bench_path,
             output_dir=output_dir,
             compress=not no_compress,
             backup_folder=backup_folder,
-            exclude_files=exclude_files
+            exclude_files=exclude_files,
+            compression_level=compression_level,
+            verbose=verbose,
+            dump_compression_level=dump_compression_level
         )
         
         if result:
@@ -68,13 +74,18 @@ def single(bench_path, output, no_compress, backup_folder, exclude_files):
 
 
 @backup.command()
-@click.argument('benches_folder', type=click.Path(exists=True, file_okay=False, dir_okay=True))
+@click.argument('benches_folder', type=click.Path(path_type=Path))
 @click.option('--output', '-o', type=click.Path(), help='Output directory for backup files')
 @click.option('--no-compress', is_flag=True, help='Do not compress the backup')
 @click.option('--backup-folder', '-b', type=click.Path(), help='Backup folder')
 @click.option('--exclude-files', is_flag=True, help='Exclude files from backup')
-def all(benches_folder, output, no_compress, backup_folder, exclude_files):
+@click.option('--compression-level', type=click.IntRange(1, 9), default=6, help='gzip compression level (1 fastest, 9 smallest)')
+@click.option('--verbose', '-v', is_flag=True, help="Show the output of each site's bench backup")
+@click.option('--dump-compression-level', type=click.IntRange(1, 9), default=1, help='gzip level for database dumps (1 fastest, 9 smallest)')
+def all(benches_folder, output, no_compress, backup_folder, exclude_files, compression_level, verbose, dump_compression_level):
     """Backup all Frappe benches in a folder"""
+    if not benches_folder.is_dir():
+        raise click.BadParameter(f"Directory '{benches_folder}' does not exist.", param_hint="'BENCHES_FOLDER'")
     try:
         output_dir = output or Path.cwd() / 'backups'
         results = backup_all_benches(
@@ -82,7 +93,10 @@ def all(benches_folder, output, no_compress, backup_folder, exclude_files):
             output_dir=output_dir,
             compress=not no_compress,
             backup_folder=backup_folder,
-            exclude_files=exclude_files
+            exclude_files=exclude_files,
+            compression_level=compression_level,
+            verbose=verbose,
+            dump_compression_level=dump_compression_level
         )
         
         if results:
@@ -107,13 +121,17 @@ def all(benches_folder, output, no_compress, backup_folder, exclude_files):
 
 
 @cli.command()
-@click.argument('backup_path', type=click.Path(exists=True))
+@click.argument('backup_path', type=click.Path(path_type=Path))
 @click.option('--target-dir', '-t', type=click.Path(), help='Target directory for restoration')
 @click.option('--skip-apps', is_flag=True, help='Skip installing apps')
 @click.option('--skip-sites', is_flag=True, help='Skip restoring sites')
 @click.option('--new-name', '-n', help='New name for the restored bench')
-def restore(backup_path, target_dir, skip_apps, skip_sites, new_name):
+@click.option('--parallel', '--jobs', '-p', '-j', 'parallel', type=click.IntRange(min=1), default=1, help='Number of sites to restore concurrently, needs root_password in common_site_config.json')
+@click.option('--resume', is_flag=True, help='Reuse the extracted backup kept by an earlier failed restore')
+def restore(backup_path, target_dir, skip_apps, skip_sites, new_name, parallel, resume):
     """Restore Frappe bench from backup"""
+    if not backup_path.exists():
+        raise click.BadParameter(f"Path '{backup_path}' does not exist.", param_hint="'BACKUP_PATH'")
     try:
         target_dir = target_dir or Path.cwd()
         result = restore_bench(
@@ -121,7 +139,9 @@ def restore(backup_path, target_dir, skip_apps, skip_sites, new_name):
             target_dir=target_dir,
             skip_apps=skip_apps,
             skip_sites=skip_sites,
-            new_name=new_name
+            new_name=new_name,
+            parallel=parallel,
+            resume=resume
         )
         
         console.print(Panel.fit(
@@ -137,10 +157,14 @@ def restore(backup_path, target_dir, skip_apps, skip_sites, new_name):
 
 
 @cli.command()
-@click.argument('bench_path', type=click.Path())
-@click.option('--info-file', '-i', type=click.Path(exists=True), help='Path to bench info JSON file')
+@click.argument('bench_path', type=click.Path(path_type=Path))
+@click.option('--info-file', '-i', type=click.Path(path_type=Path), help='Path to bench info JSON file')
 def create(bench_path, info_file):
     """Create a new Frappe bench"""
+    if info_file and not info_file.exists():
+        raise click.BadParameter(f"File '{info_file}' does not exist.", param_hint="'--info-file'")
+    # bench's init machinery is only needed here, keep it off the path of every other command
+    from .commands.create import create_bench
     try:
         result = create_bench(
             bench_path=bench_path,
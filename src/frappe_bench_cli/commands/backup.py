@@ -1,12 +1,133 @@
 import os
-import json
+import shlex
 import shutil
+import tarfile
+import tempfile
 import subprocess
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from functools import cached_property, lru_cache, partial
 from pathlib import Path
-from rich.console import Console
-from typing import Optional, List, Dict, Any, Union
+from typing import Optional, List, Dict, Any, Tuple, Union
 from datetime import datetime
-from git import Repo
+
+from .. import _json
+from .._fs import remove_in_background
+from .._ui import console, console_lock
+
+
+def _git_info(app_dir: Path) -> Tuple[str, str]:
+    """Read the upstream remote URL and checked out branch of an app repository."""
+    def git(*args: str) -> str:
+        result = subprocess.run(
+            ["git", "-C", str(app_dir), *args],
+            capture_output=True,
+            text=True
+        )
+        if result.returncode:
+            raise RuntimeError(result.stderr.strip() or f"git {' '.join(args)} failed")
+        return result.stdout.strip()
+
+    remote_url = git("config", "--get", "remote.upstream.url")
+    branch = git("rev-parse", "--abbrev-ref", "HEAD")
+    if branch == "HEAD":
+        raise RuntimeError("HEAD is detached, no active branch")
+    return remote_url, branch
+
+
+@contextmanager
+def _dump_gzip_env(level: Optional[int], threads: Optional[int] = None):
+    """Yield the environment for ``bench backup`` so database dumps are gzipped at level.
+
+    frappe pipes mysqldump through the first gzip on PATH and has no option for the
+    level, so a wrapper named gzip that runs pigz (or gzip) with ``-<level>`` is put
+    in front of PATH for the duration. pigz is limited to threads when given. Yields
+    None, i.e. the inherited environment, when level is None or no compressor is installed.
+    """
+    pigz = shutil.which('pigz')
+    compressor = pigz or shutil.which('gzip')
+    if not level or not compressor:
+        yield None
+        return
+    args = f'-{level}'
+    if pigz and threads:
+        args = f'-p {threads} {args}'
+    path = os.environ.get('PATH', '')
+    wrapper_dir = tempfile.mkdtemp(prefix='fbm_gzip_')
+    try:
+        wrapper = os.path.join(wrapper_dir, 'gzip')
+        with open(wrapper, 'w') as f:
+            # The compressor gets the original PATH back, so a gzip it runs isn't the wrapper again
+            f.write(
+                f"#!/bin/sh\n"
+                f"PATH={shlex.quote(path)}\n"
+                f"export PATH\n"
+                f'exec {shlex.quote(compressor)} {args} "$@"\n'
+            )
+        os.chmod(wrapper, 0o755)
+        yield {**os.environ, 'PATH': os.pathsep.join([wrapper_dir, path])}
+    finally:
+        shutil.rmtree(wrapper_dir, ignore_errors=True)
+
+
+def _make_archive_fast(
+    src_dir: Path,
+    dst_base: Path,
+    compression_level: int = 6,
+    gzip: bool = True,
+    threads: Optional[int] = None
+) -> Path:
+    """Archive the contents of src_dir as ``<dst_base>.tar.gz``, or ``<dst_base>.tar`` without gzip.
+
+    Streams system tar into pigz for multi-core compression (threads, all cores by default),
+    or into gzip when pigz is missing. The in-process tarfile module is only used when tar
+    itself is unavailable.
+    """
+    archive_path = dst_base.with_name(f"{dst_base.name}.tar.gz" if gzip else f"{dst_base.name}.tar")
+    tar_bin = shutil.which('tar')
+    pigz = shutil.which('pigz')
+    gzip_bin = pigz or shutil.which('gzip')
+    if not tar_bin or (gzip and not gzip_bin):
+        if gzip:
+            # shutil.make_archive always gzips at level 9, honour compression_level instead
+            tar = tarfile.open(archive_path, 'w:gz', compresslevel=compression_level)
+        else:
+            tar = tarfile.open(archive_path, 'w')
+        with tar:
+            tar.add(src_dir, arcname='.')
+        return archive_path
+
+    if not gzip:
+        result = subprocess.run([tar_bin, '-cf', str(archive_path), '-C', str(src_dir), '.'])
+        if result.returncode:
+            if archive_path.exists():
+                archive_path.unlink()
+            raise RuntimeError(f"Failed to archive {src_dir} (tar={result.returncode})")
+        return archive_path
+
+    gzip_args = [gzip_bin, f'-{compression_level}', '-c']
+    if pigz:
+        gzip_args[1:1] = ['-p', str(threads or os.cpu_count() or 1)]
+
+    with open(archive_path, 'wb') as archive:
+        tar = subprocess.Popen(
+            [tar_bin, '-cf', '-', '-C', str(src_dir), '.'],
+            stdout=subprocess.PIPE
+        )
+        compressor = subprocess.Popen(
+            gzip_args,
+            stdin=tar.stdout,
+            stdout=archive
+        )
+        tar.stdout.close()  # Let tar receive SIGPIPE if the compressor exits early
+        gzip_code = compressor.wait()
+        tar_code = tar.wait()
+
+    if tar_code or gzip_code:
+        if archive_path.exists():
+            archive_path.unlink()
+        raise RuntimeError(f"Failed to compress {src_dir} (tar={tar_code}, gzip={gzip_code})")
+    return archive_path
 
 
 class BenchBackupManager:
@@ -16,63 +137,105 @@ class BenchBackupManager:
         output_dir: Union[str, Path],
         compress: bool = True,
         exclude_files: bool = False,
-        backup_folder: Optional[str] = None
+        backup_folder: Optional[str] = None,
+        compression_level: int = 6,
+        site_workers: Optional[int] = None,
+        bench_workers: Optional[int] = None,
+        pretty_json: bool = True,
+        verbose: bool = False,
+        dump_compression_level: Optional[int] = 1,
+        compress_threads: Optional[int] = None
     ):
         self.bench_dir = Path(bench_dir)
         self.output_dir = Path(output_dir)
         self.compress = compress
+        self.compression_level = compression_level
+        # Each site backup runs mysqldump against the same database server, keep the default modest
+        self.site_workers = site_workers or min(4, os.cpu_count() or 1)
+        # Every bench worker runs its own site pool and pigz, backup_benches splits those between them
+        self.bench_workers = bench_workers or min(2, os.cpu_count() or 1)
+        self.compress_threads = compress_threads or os.cpu_count() or 1
+        self.pretty_json = pretty_json
+        self.verbose = verbose
+        self.dump_compression_level = dump_compression_level
         self.exclude_files = exclude_files
         self.backup_folder = Path(backup_folder) if backup_folder else None
-        self.console = Console()
+        self.console = console
+        self._sites_cache: Dict[str, List[str]] = {}
 
         if not self.bench_dir.exists():
             raise FileNotFoundError(f"Bench directory not found: {self.bench_dir}")
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
+    def _config_dict(self) -> Dict[str, Any]:
+        """Picklable constructor arguments, used to rebuild the manager in worker processes."""
+        return {
+            'bench_dir': str(self.bench_dir),
+            'output_dir': str(self.output_dir),
+            'compress': self.compress,
+            'exclude_files': self.exclude_files,
+            'backup_folder': str(self.backup_folder) if self.backup_folder else None,
+            'compression_level': self.compression_level,
+            'site_workers': self.site_workers,
+            'bench_workers': self.bench_workers,
+            'pretty_json': self.pretty_json,
+            'verbose': self.verbose,
+            'dump_compression_level': self.dump_compression_level,
+            'compress_threads': self.compress_threads,
+        }
+
     def sites(self, bench_path: Path) -> List[str]:
-        return [
-            path
-            for path in os.listdir(os.path.join(bench_path, "sites"))
-            if os.path.exists(os.path.join(bench_path, "sites", path, "site_config.json"))
-        ]
+        key = os.fspath(bench_path)
+        if key not in self._sites_cache:
+            join = os.path.join
+            with os.scandir(join(key, "sites")) as entries:
+                self._sites_cache[key] = [
+                    entry.name
+                    for entry in entries
+                    if entry.is_dir() and os.path.isfile(join(entry.path, "site_config.json"))
+                ]
+        return self._sites_cache[key]
         
-    @property
+    @cached_property
     def benches(self) -> List[Path]:
-        return [
-            path
-            for path in self.bench_dir.iterdir()
-            if self.is_valid_bench(path)
-        ]
+        # A single scandir pass, DirEntry.is_dir() reuses the type info from the directory listing
+        with os.scandir(self.bench_dir) as entries:
+            return [
+                Path(entry.path)
+                for entry in entries
+                if entry.is_dir() and self._is_bench_dir(entry.path)
+            ]
+
+    def invalidate_cache(self) -> None:
+        """Forget discovered benches and sites so the next access rescans the filesystem."""
+        self.__dict__.pop('benches', None)
+        self._sites_cache.clear()
+
+    @staticmethod
+    def _is_bench_dir(path: str) -> bool:
+        return os.path.isdir(os.path.join(path, 'apps')) and os.path.isdir(os.path.join(path, 'sites'))
     
     @staticmethod
     def is_valid_bench(bench_path: Path) -> bool:
         """Check if the given path is a valid Frappe bench."""
-        return (
-            bench_path.exists() and
-            (bench_path / 'apps').exists() and
-            (bench_path / 'sites').exists()
-        )
+        return BenchBackupManager._is_bench_dir(os.fspath(bench_path))
         
     @staticmethod
+    @lru_cache(maxsize=None)
     def get_python_version_from_bench(bench_path):
-        python_executable = os.path.join(bench_path, 'env', 'bin', 'python')
-
-        if not os.path.isfile(python_executable):
-            return None
+        # The venv records its interpreter version in pyvenv.cfg, no need to run the interpreter
+        pyvenv_cfg = os.path.join(bench_path, 'env', 'pyvenv.cfg')
 
         try:
-            result = subprocess.run(
-                [python_executable, '--version'],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            version_output = result.stdout.strip() or result.stderr.strip()  # Sometimes it's in stderr
-            _, version = version_output.split()
-            major, minor, *_ = version.split(".")
-            return f"python{major}.{minor}"
-        except Exception as e:
-            return None 
+            with open(pyvenv_cfg) as f:
+                for line in f:
+                    if line.startswith('version'):  # "version" (venv) or "version_info" (virtualenv)
+                        _, version = line.split('=', 1)
+                        major, minor, *_ = version.strip().split(".")
+                        return f"python{major}.{minor}"
+        except (OSError, ValueError):
+            pass
+        return None
         
     def get_bench_info(self, bench_path: Path) -> Dict[str, Any]:
         """Extract information about a bench including apps and sites."""
@@ -86,17 +249,27 @@ class BenchBackupManager:
             'sites': []
         }
 
-        for app_dir in (bench_path / 'apps').iterdir():
-            if app_dir.is_dir() and (app_dir / '.git').exists():
-                try:
-                    repo = Repo(app_dir)
-                    remote_url = repo.remotes.upstream.url
-                    branch = repo.active_branch.name
-                    info['apps'].append({'name': app_dir.name, 'git_url': remote_url, 'version': branch})
-                    if app_dir.name == 'frappe':
-                        info['version'] = branch
-                except Exception as e:
-                    self.console.print(f"[yellow]Warning: Could not get git info for {app_dir.name}: {e}[/yellow]")
+        # DirEntry.is_dir() is answered from the listing, leaving one stat per app for .git
+        with os.scandir(os.path.join(bench_path, 'apps')) as entries:
+            app_dirs = [
+                Path(entry.path)
+                for entry in entries
+                if entry.is_dir() and os.path.exists(os.path.join(entry.path, '.git'))
+            ]
+        # Probe git metadata for all apps concurrently, each probe is a couple of short git calls
+        futures = []
+        if app_dirs:
+            with ThreadPoolExecutor(max_workers=min(8, len(app_dirs))) as executor:
+                futures = [executor.submit(_git_info, app_dir) for app_dir in app_dirs]
+
+        for app_dir, future in zip(app_dirs, futures):
+            try:
+                remote_url, branch = future.result()
+                info['apps'].append({'name': app_dir.name, 'git_url': remote_url, 'version': branch})
+                if app_dir.name == 'frappe':
+                    info['version'] = branch
+            except Exception as e:
+                self.console.print(f"[yellow]Warning: Could not get git info for {app_dir.name}: {e}[/yellow]")
 
         info['sites'] = [
             {
@@ -107,6 +280,82 @@ class BenchBackupManager:
 
         return info
 
+    @staticmethod
+    def _is_precompressed(bench_info: Dict[str, Any]) -> bool:
+        """Check whether every site artifact is already gzipped, so the outer archive gains nothing from gzip."""
+        artifacts = [
+            path
+            for site in bench_info['sites']
+            for path in site.get('backup_paths', {}).values()
+            if path
+        ]
+        return bool(artifacts) and all(path.endswith(('.gz', '.tgz')) for path in artifacts)
+
+    def _print(self, message: str) -> None:
+        """Print to the console, serialized across site backup threads."""
+        with console_lock:
+            self.console.print(message)
+
+    def _backup_site(
+        self,
+        site: Dict[str, Any],
+        sites_backup_dir: Path,
+        bench_path: Path,
+        backup_dir: Path,
+        env: Optional[Dict[str, str]] = None
+    ) -> Dict[str, Any]:
+        """Backup a single site of a bench and record its backup paths in the site metadata.
+
+        Errors are raised to the caller, which reports them once all site workers are done.
+        """
+        site_name = site['name']
+        self._print(f"[cyan]Backing up site {site_name}...[/cyan]")
+        site_dir = sites_backup_dir / site_name
+
+        # Run backup with specific paths
+        cmd_args = [
+            "bench",
+            "--site", site_name,
+            "backup",
+            "--backup-path", f"{site_dir}",
+        ]
+        if not self.exclude_files:
+            cmd_args.append("--with-files")
+        # Only keep bench's output when it will be shown, stderr is always kept for errors
+        result = subprocess.run(
+            cmd_args,
+            cwd=bench_path,
+            env=env,
+            stdout=subprocess.PIPE if self.verbose else subprocess.DEVNULL,
+            stderr=subprocess.PIPE
+        )
+        if result.returncode:
+            error = result.stderr.decode(errors='replace').strip()
+            raise RuntimeError(error or f"bench backup exited with status {result.returncode}")
+        if self.verbose:
+            if result.stderr:
+                self._print(f"[yellow]{result.stderr.decode(errors='replace')}[/yellow]")
+            if result.stdout:
+                self._print(f"[cyan]{result.stdout.decode(errors='replace')}[/cyan]")
+        # Classify the backup artifacts in one directory pass
+        db_backup = files_backup = private_files_backup = None
+        with os.scandir(site_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith("-database.sql.gz"):
+                    db_backup = Path(entry.path)
+                elif entry.name.endswith("-private-files.tar"):
+                    private_files_backup = Path(entry.path)
+                elif entry.name.endswith("-files.tar"):
+                    files_backup = Path(entry.path)
+
+        # Update site metadata with backup paths
+        site['backup_paths'] = {
+            'database': str(db_backup.relative_to(backup_dir)) if db_backup else '',
+            'files': str(files_backup.relative_to(backup_dir)) if files_backup else '',
+            'private_files': str(private_files_backup.relative_to(backup_dir)) if private_files_backup else ''
+        }
+        return site
+
     def backup_single_bench(self, bench_path: Path) -> Path:
         """Backup a single bench to the output directory."""
         bench_info = self.get_bench_info(bench_path)
@@ -118,94 +367,114 @@ class BenchBackupManager:
         sites_backup_dir = backup_dir / 'sites_backup'
         backup_dir.mkdir(parents=True)
         sites_backup_dir.mkdir(parents=True)
+        # Create every site directory upfront, the workers only have to run bench
+        for site in bench_info['sites']:
+            (sites_backup_dir / site['name']).mkdir()
 
-        # Save bench metadata
-        with open(backup_dir / 'bench_info.json', 'w') as f:
-            json.dump(bench_info, f, indent=2)
+        # Backup sites concurrently, each bench backup is dominated by mysqldump and file I/O
+        max_workers = max(1, min(len(bench_info['sites']), self.site_workers))
+        # Concurrent dumps share the compressor threads
+        dump_threads = max(1, self.compress_threads // max_workers)
+        # Level 1 dumps are roughly twice as fast as gzip's default for ~5% larger files
+        with _dump_gzip_env(self.dump_compression_level, dump_threads) as env, \
+                ThreadPoolExecutor(max_workers=max_workers) as executor:
+            backup_site = partial(
+                self._backup_site,
+                sites_backup_dir=sites_backup_dir,
+                bench_path=bench_path,
+                backup_dir=backup_dir,
+                env=env
+            )
+            futures = {executor.submit(backup_site, site): site['name'] for site in bench_info['sites']}
 
-        # Backup each site
-        for site in bench_info['sites']:
-            site_name = site['name']
-            self.console.print(f"[cyan]Backing up site {site_name}...[/cyan]")
-            site_dir = sites_backup_dir / site_name
-            site_dir.mkdir(parents=True)
-            
-            try:
-                # Run backup with specific paths
-                cmd_args = [
-                    "bench",
-                    "--site", site_name,
-                    "backup",
-                    "--backup-path", f"{site_dir}",
-                ]
-                if not self.exclude_files:
-                    cmd_args.append("--with-files")
-                result = subprocess.run(
-                    cmd_args,
-                    cwd=bench_path,
-                    capture_output=True,
-                    text=True,  # This ensures output is returned as string
-                    check=True
-                )
-                if result.stderr:
-                    self.console.print(f"[yellow]{result.stderr}[/yellow]")
-                if result.stdout:
-                    self.console.print(f"[cyan]{result.stdout}[/cyan]")
-                db_backup = next(site_dir.glob("*-database.sql.gz"), None)
-                files_backup = next(site_dir.glob("*-files.tar"), None)
-                private_files_backup = next(site_dir.glob("*-private-files.tar"), None)
-
-                # Update site metadata with backup paths
-                site['backup_paths'] = {
-                    'database': str(db_backup.relative_to(backup_dir)) if db_backup else '',
-                    'files': str(files_backup.relative_to(backup_dir)) if files_backup else '',
-                    'private_files': str(private_files_backup.relative_to(backup_dir)) if private_files_backup else ''
-                }
-            except Exception as e:
+        # Report failures from the main thread so they do not interleave with worker output
+        for future, site_name in futures.items():
+            error = future.exception()
+            if error is not None:
                 import traceback
-                traceback.print_exc()
-                self.console.print(f"[red]Error backing up site {site_name}: {e}[/red]")
+                traceback.print_exception(type(error), error, error.__traceback__)
+                self.console.print(f"[red]Error backing up site {site_name}: {error}[/red]")
 
-        # Update bench_info with the new site metadata
-        with open(backup_dir / 'bench_info.json', 'w') as f:
-            json.dump(bench_info, f, indent=2)
+        # Save bench metadata once all site backup paths are known
+        _json.dump(bench_info, backup_dir / 'bench_info.json', pretty=self.pretty_json)
 
         # Compress directory if requested
         if self.compress:
-            archive = shutil.make_archive(str(backup_dir), 'gztar', root_dir=backup_dir)
-            shutil.rmtree(backup_dir)
-            return Path(archive)
+            # Site dumps that are already gzipped only need to be bundled, not gzipped again
+            archive = _make_archive_fast(
+                backup_dir,
+                backup_dir,
+                self.compression_level,
+                gzip=not self._is_precompressed(bench_info),
+                threads=self.compress_threads
+            )
+            remove_in_background(backup_dir)
+            return archive
         return backup_dir
 
     def backup_benches(self) -> Union[Path, List[Path], None]:
         """Backup one or all benches under the bench directory."""
         results: List[Path] = []
-        for path in self.benches:
-            try:
-                result = self.backup_single_bench(path)
-                results.append(result)
-                self.console.print(f"[green]Backed up {path.name} -> {result}[/green]")
-            except Exception as e:
-                import traceback
-                traceback.print_exc()
-                self.console.print(f"[red]Failed to backup {path.name}: {e}[/red]")
+        benches = self.benches
+        if not benches:
+            return results
+
+        # Never start more worker processes than there are benches to back up
+        pool_size = min(len(benches), self.bench_workers)
+        # The site and compressor budgets are shared by all benches, not granted to each, so
+        # the database server sees at most site_workers dumps at once
+        config = self._config_dict()
+        config['site_workers'] = max(1, self.site_workers // pool_size)
+        config['compress_threads'] = max(1, self.compress_threads // pool_size)
+        with ProcessPoolExecutor(max_workers=pool_size) as executor:
+            futures = {
+                executor.submit(_backup_one, path, config): path
+                for path in benches
+            }
+            # A plain counter instead of a live progress bar, cheap and readable in non-TTY logs
+            total = len(futures)
+            for done, future in enumerate(as_completed(futures), start=1):
+                path = futures[future]
+                try:
+                    result = future.result()
+                    results.append(result)
+                    self.console.print(f"[green][{done}/{total}] Backed up {path.name} -> {result}[/green]")
+                except Exception as e:
+                    self.console.print(f"[red][{done}/{total}] Failed to backup {path.name}: {e}[/red]")
 
         return results
 
+
+def _backup_one(bench_path: Path, config: Dict[str, Any]) -> Path:
+    """Backup a single bench in a worker process."""
+    manager = BenchBackupManager(**config)
+    try:
+        return manager.backup_single_bench(bench_path)
+    except Exception:
+        import traceback
+        traceback.print_exc()
+        raise
+
 def backup_bench(
     bench_path: Path = None,
     output_dir: Path = None,
     compress: bool = True,
     exclude_files: bool = False,
     backup_folder: Optional[str] = None,
-    benches_folder: Optional[str] = None
+    benches_folder: Optional[str] = None,
+    compression_level: int = 6,
+    verbose: bool = False,
+    dump_compression_level: Optional[int] = 1
 ):
     manager = BenchBackupManager(
         bench_dir=bench_path or benches_folder,
         output_dir=output_dir,
         compress=compress,
         exclude_files=exclude_files,
-        backup_folder=backup_folder
+        backup_folder=backup_folder,
+        compression_level=compression_level,
+        verbose=verbose,
+        dump_compression_level=dump_compression_level
     )
     if not benches_folder:
         return manager.backup_single_bench(bench_path=bench_path)
@@ -216,7 +485,10 @@ def backup_all_benches(
     output_dir: Union[str, Path],
     compress: bool = True,
     exclude_files: bool = False,
-    backup_folder: Optional[str] = None
+    backup_folder: Optional[str] = None,
+    compression_level: int = 6,
+    verbose: bool = False,
+    dump_compression_level: Optional[int] = 1
 ) -> List[Path]:
     """
     Backup all benches found in the specified folder.
@@ -227,6 +499,9 @@ def backup_all_benches(
         compress: Whether to compress the backup
         exclude_files: Whether to exclude files from backup
         backup_folder: Specific folder to create backup in
+        compression_level: gzip level (1-9) used when compressing
+        verbose: Whether to print the output of each site's bench backup
+        dump_compression_level: gzip level for the database dumps, None for gzip's default
         
     Returns:
         List of paths to the created backups
@@ -236,7 +511,10 @@ def backup_all_benches(
         compress=compress,
         exclude_files=exclude_files,
         backup_folder=backup_folder,
-        benches_folder=benches_folder
+        benches_folder=benches_folder,
+        compression_level=compression_level,
+        verbose=verbose,
+        dump_compression_level=dump_compression_level
     )
 
 if __name__ == '__main__':
@@ -1,25 +1,49 @@
 import os
-import json
 from pathlib import Path
 import subprocess
-from typing import Optional
-from rich.console import Console
+from typing import Optional, Union, Dict, Any
 from bench.utils.system import init
+from .. import _json
+from .._ui import console
 
 class BenchCreator:
     def __init__(self):
-        self.console = Console()
+        self.console = console
+
+    def run_bench(self, bench_path, args):
+        """Run a bench command, streaming its output instead of buffering it, and return its exit status"""
+        with subprocess.Popen(
+            args,
+            cwd=str(bench_path),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1
+        ) as proc:
+            for line in proc.stdout:
+                self.console.print(f"  {line.rstrip()}", style="dim", markup=False, highlight=False)
+        return proc.returncode
+
+    def get_app(self, bench_path, app):
+        """Fetch an app with bench get-app"""
+        # Assets are built once for all apps instead of once per app
+        args = ['bench', 'get-app', app['git_url'], '--skip-assets']
+        if app.get('version'):
+            args.extend(['--branch',app.get('version')])
+        return self.run_bench(bench_path, args)
 
     def create_bench_from_info(self, bench_path, info_file, skip_apps=False):
-        """Create a bench using configuration from info file"""
+        """Create a bench using configuration from info file, or from an already loaded info dict"""
         bench_path = Path(bench_path)
-        info_file = Path(info_file)
-        
-        if not info_file.exists():
-            raise FileNotFoundError(f"Bench info file not found at {info_file}")
+        if isinstance(info_file, dict):
+            bench_info = info_file
+        else:
+            info_file = Path(info_file)
             
-        with open(info_file) as f:
-            bench_info = json.load(f)
+            if not info_file.exists():
+                raise FileNotFoundError(f"Bench info file not found at {info_file}")
+                
+            bench_info = _json.load(info_file)
         
         if not bench_path.exists():
             bench_path.mkdir(parents=True, exist_ok=True)
@@ -28,21 +52,25 @@ class BenchCreator:
             self.console.print(f"[green]Bench {bench_path} already exist[/green]")
         # Install apps from info
         if not skip_apps:
-            for app in bench_info.get('apps', []):
-                if app.get('name') == "frappe": continue
+            apps = [app for app in bench_info.get('apps', []) if app.get('name') != "frappe"]
+            # Apps are fetched one at a time, concurrent get-app calls would race on the
+            # shared env and sites/apps.txt
+            for app in apps:
                 try:
                     self.console.print(f"[cyan]get app {app['name']}...[/cyan]")
-                    args = ['bench', 'get-app', app['git_url']]
-                    if app.get('version'):
-                        args.extend(['--branch',app.get('version')])
-                    result = subprocess.run(
-                        args,
-                        cwd=str(bench_path),
-                        capture_output=True,
-                        text=True
-                    )
+                    returncode = self.get_app(bench_path, app)
+                    if returncode:
+                        self.console.print(f"[red]Error get app {app['name']}: exited with status {returncode}[/red]")
                 except Exception as e:
                     self.console.print(f"[red]Error get app {app['name']}: {str(e)}[/red]")
+            if apps:
+                self.console.print("[cyan]Building assets...[/cyan]")
+                try:
+                    returncode = self.run_bench(bench_path, ['bench', 'build'])
+                    if returncode:
+                        self.console.print(f"[red]Error building assets: exited with status {returncode}[/red]")
+                except Exception as e:
+                    self.console.print(f"[red]Error building assets: {str(e)}[/red]")
         
         # Create sites from info
         for site in bench_info.get('sites', []):
@@ -66,7 +94,7 @@ class BenchCreator:
         
         Args:
             bench_path (str): Path where the bench should be created
-            info_file (str, optional): Path to bench info JSON file
+            info_file (str or dict, optional): Path to bench info JSON file, or its parsed contents
             skip_apps (bool, optional): Whether to skip installing apps
             
         Returns:
@@ -74,7 +102,7 @@ class BenchCreator:
         """
         bench_path = Path(bench_path)
         
-        if info_file:
+        if info_file is not None:
             return self.create_bench_from_info(bench_path, info_file, skip_apps)
         
         # Use standard bench init
@@ -82,6 +110,6 @@ class BenchCreator:
         init(bench_path)
         return bench_path
     
-def create_bench(bench_path: str, info_file: Optional[str] = None, skip_apps: bool = False, *args,**kwargs) -> Path:
+def create_bench(bench_path: str, info_file: Optional[Union[str, Dict[str, Any]]] = None, skip_apps: bool = False, *args,**kwargs) -> Path:
     creator = BenchCreator()
     return creator.create_bench(bench_path, info_file, skip_apps, *args,**kwargs)
@@ -1,37 +1,137 @@
+import hashlib
+import logging
 import os
-import json
 import shutil
 import tarfile
 import subprocess
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from git import Repo
-from rich.console import Console
-from rich.progress import Progress
-from .create import create_bench
-from typing import Optional, Dict, Any, Tuple
+from .. import _json
+from .._fs import remove_in_background
+from .._ui import console
+from typing import Optional, Dict, Any
 from contextlib import contextmanager
 
+try:
+    import libarchive
+except ImportError:
+    libarchive = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_SUFFIXES = ('.gz', '.tgz', '.tar', '.zst')
+GZIP_SUFFIXES = ('.gz', '.tgz')
+
+# tarfile's stream reads and per-member copies default to 16 KiB chunks
+_TAR_BUFSIZE = 1 << 20
+_TAR_COPYBUFSIZE = 2 << 20
+
+_SITE_SUBDIRS = ('public/files', 'private/backups', 'private/files', 'locks', 'logs')
+
+# Written into a resumable extraction directory once extraction has completed
+_EXTRACTED_MARKER = '.fbm_extracted'
+
+# Rough extracted-to-archive size ratio for a gzipped bench backup
+_EXTRACTED_SIZE_RATIO = 3.5
+
+
+def _safe_members(tar: tarfile.TarFile):
+    """Yield archive members that stay inside the extraction directory, with plain permissions."""
+    for member in tar:
+        if os.path.isabs(member.name) or '..' in Path(member.name).parts:
+            continue
+        if member.issym() or member.islnk() or member.isdev():
+            continue
+        member.mode &= 0o755
+        yield member
+
+
+def _extract_all(tar: tarfile.TarFile, path: str) -> None:
+    """Extract an archive, skipping unsafe members and special permission bits."""
+    if hasattr(tarfile, 'data_filter'):
+        tar.extractall(path, filter='data')
+    else:
+        # Python releases without extraction filters
+        tar.extractall(path, members=_safe_members(tar))
+
+
+def _fadvise(f, advice: int) -> None:
+    """Give the kernel an access pattern hint for a whole file, where supported."""
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    try:
+        os.posix_fadvise(f.fileno(), 0, 0, advice)
+    except OSError:
+        pass
+
+
+@contextmanager
+def _open_sequential(path: Path):
+    """Open a file for a single front-to-back read.
+
+    The kernel is told to read ahead aggressively, and to drop the file's pages
+    from the cache once the read is done so they don't evict anything useful.
+    """
+    with open(path, 'rb', buffering=1 << 20) as f:
+        _fadvise(f, getattr(os, 'POSIX_FADV_SEQUENTIAL', 0))
+        try:
+            yield f
+        finally:
+            _fadvise(f, getattr(os, 'POSIX_FADV_DONTNEED', 0))
+
+
+def _choose_gunzip() -> Optional[str]:
+    """Return the fastest gzip decompressor on PATH, preferring parallel ones."""
+    for name in ('rapidgzip', 'pigz', 'gzip'):
+        path = shutil.which(name)
+        if path:
+            return path
+    return None
+
+
+def _choose_unzstd() -> Optional[str]:
+    """Return a zstd decompressor on PATH, preferring the parallel pzstd."""
+    for name in ('pzstd', 'zstd'):
+        path = shutil.which(name)
+        if path:
+            return path
+    return None
+
+
 class BenchRestorer:
-    def __init__(self, backup_path: str, target_dir: str):
+    def __init__(self, backup_path: str, target_dir: str, resume: bool = False):
         """
         Initialize BenchRestorer with backup path and target directory
         
         Args:
             backup_path (str): Path to the backup file or directory
             target_dir (str): Directory where to restore the bench
+            resume (bool, optional): Reuse an extraction of this backup kept by an earlier
+                failed restore, and keep this one if the restore fails
         """
-        self.console = Console()
+        self.console = console
         self.backup_path = Path(backup_path)
-        self.target_dir = Path(target_dir)
+        # Absolute, since paths under it are handed to frappe, which runs from sites/
+        self.target_dir = Path(target_dir).absolute()
+        self.resume = resume
         
-        if not self.backup_path.exists():
-            raise FileNotFoundError(f"Backup file not found: {self.backup_path}")
+        try:
+            self._backup_stat = os.stat(self.backup_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Backup file not found: {self.backup_path}") from None
+        self._backup_size = self._backup_stat.st_size
         
         self.temp_dir = None
         self.extracted_dir = None
         self.bench_info = None
         self.bench_dir = None
+        self.sites_dir = None
         self.sites_backup_dir = None
         
         # Extract backup and load bench info
@@ -45,19 +145,205 @@ class BenchRestorer:
         Returns:
             Path: Path to the extracted backup directory
         """
-        if self.backup_path.suffix == '.gz':
-            self.temp_dir = tempfile.mkdtemp(prefix="frappe_bench_restore_")
-            self.console.print(f"[cyan]Extracting backup to temporary directory: {self.temp_dir}[/cyan]")
-            
-            with tarfile.open(self.backup_path, 'r:gz') as tar:
-                tar.extractall(self.temp_dir)
-            
-            self.extracted_dir = Path(self.temp_dir)
-            return self.extracted_dir
-        else:
+        if self.backup_path.is_dir():
             self.extracted_dir = self.backup_path
             return self.extracted_dir
 
+        # Known suffixes skip the probe, which has to decompress the first block
+        if self.backup_path.suffix not in ARCHIVE_SUFFIXES and not tarfile.is_tarfile(str(self.backup_path)):
+            raise ValueError(f"Backup is neither a directory nor a tar archive: {self.backup_path}")
+
+        if self.resume:
+            self.temp_dir = self._resume_dir()
+            if os.path.exists(os.path.join(self.temp_dir, _EXTRACTED_MARKER)):
+                self.console.print(f"[cyan]Reusing extracted backup in {self.temp_dir}[/cyan]")
+                self.extracted_dir = Path(self.temp_dir)
+                return self.extracted_dir
+            os.makedirs(self.temp_dir, exist_ok=True)
+        else:
+            self.temp_dir = tempfile.mkdtemp(prefix="frappe_bench_restore_", dir=self._temp_parent())
+        self.console.print(f"[cyan]Extracting backup to temporary directory: {self.temp_dir}[/cyan]")
+        
+        tar_bin = shutil.which('tar')
+        if self.backup_path.suffix == '.zst' and not _choose_unzstd():
+            # tar needs a zstd binary as well, decompress in-process instead
+            tar_bin = None
+        if tar_bin:
+            self._extract_with_tar(tar_bin)
+        elif libarchive is not None:
+            self._extract_with_libarchive()
+        else:
+            with self._open_archive() as tar:
+                _extract_all(tar, self.temp_dir)
+        
+        self.extracted_dir = Path(self.temp_dir)
+        if self.resume:
+            # Only a completed extraction is reused, an interrupted one is extracted over
+            (self.extracted_dir / _EXTRACTED_MARKER).touch()
+        return self.extracted_dir
+
+    def _resume_dir(self) -> str:
+        """
+        Deterministic extraction directory for this backup file, used with resume
+        
+        The name is keyed on the file's identity and mtime, so a replaced or modified
+        backup never picks up a stale extraction.
+        
+        Returns:
+            str: Absolute path of the extraction directory, which may not exist yet
+        """
+        st = self._backup_stat
+        key = hashlib.sha1(f"{st.st_dev}:{st.st_ino}:{st.st_mtime_ns}:{st.st_size}".encode()).hexdigest()[:16]
+        name = f"frappe_bench_restore_{key}"
+        # An earlier run may have picked either location, see _temp_parent
+        # Absolute, since files under it are handed to frappe, which runs from sites/
+        for parent in (tempfile.gettempdir(), str(self.target_dir)):
+            candidate = os.path.abspath(os.path.join(parent, name))
+            if os.path.isdir(candidate):
+                return candidate
+        return os.path.abspath(os.path.join(self._temp_parent() or tempfile.gettempdir(), name))
+
+    def _temp_parent(self) -> Optional[str]:
+        """
+        Choose where to extract the backup
+        
+        Small backups go to the system temp directory, often a tmpfs. Backups whose
+        extracted size would not comfortably fit there go under target_dir instead,
+        on the same filesystem as the restored bench.
+        
+        Returns:
+            Optional[str]: Parent directory for mkdtemp, None for the system default
+        """
+        tmp = tempfile.gettempdir()
+        estimated_size = self._backup_size * _EXTRACTED_SIZE_RATIO
+        if estimated_size <= shutil.disk_usage(tmp).free / 2:
+            return None
+        self.target_dir.mkdir(parents=True, exist_ok=True)
+        return str(self.target_dir)
+
+    def _decompressor(self) -> Optional[str]:
+        """
+        Pick an external decompressor for the backup from its suffix
+        
+        Returns:
+            Optional[str]: Path to a program accepting -d -c, or None for uncompressed or unknown archives
+        """
+        if self.backup_path.suffix in GZIP_SUFFIXES:
+            return _choose_gunzip()
+        if self.backup_path.suffix == '.zst':
+            return _choose_unzstd()
+        return None
+
+    def _extract_with_tar(self, tar_bin: str) -> None:
+        """
+        Extract the backup archive with the system tar
+        
+        Compressed archives are decompressed by a separate process (see _decompressor)
+        piped into tar, so decompression and extraction run on different cores. The
+        backup is handed to the first process as its stdin, opened by _open_sequential.
+        
+        Args:
+            tar_bin (str): Path to the tar executable
+        """
+        with _open_sequential(self.backup_path) as src:
+            self._run_tar(tar_bin, src)
+
+    def _run_tar(self, tar_bin: str, src) -> None:
+        """Run the extraction pipeline for _extract_with_tar, reading the backup from src"""
+        decompressor_bin = self._decompressor()
+        if not decompressor_bin:
+            if self.backup_path.suffix == '.tar':
+                args, stdin = ['-xf', '-'], src
+            else:
+                # tar only detects compression by itself when reading from a named file
+                args, stdin = ['-xf', str(self.backup_path)], None
+            result = subprocess.run(
+                [tar_bin, '--no-same-owner', *args, '-C', self.temp_dir],
+                stdin=stdin,
+                stderr=subprocess.PIPE,
+                text=True
+            )
+            if result.returncode:
+                raise RuntimeError(f"tar failed to extract {self.backup_path}: {result.stderr.strip()}")
+            return
+
+        decompressor = subprocess.Popen(
+            [decompressor_bin, '-d', '-c'],
+            stdin=src,
+            stdout=subprocess.PIPE
+        )
+        tar = subprocess.Popen(
+            [tar_bin, '--no-same-owner', '-xf', '-', '-C', self.temp_dir],
+            stdin=decompressor.stdout,
+            stderr=subprocess.PIPE
+        )
+        # Let the decompressor get SIGPIPE if tar exits early
+        decompressor.stdout.close()
+        _, tar_err = tar.communicate()
+        decompress_status = decompressor.wait()
+
+        if decompress_status or tar.returncode:
+            raise RuntimeError(
+                f"Failed to extract {self.backup_path} "
+                f"({os.path.basename(decompressor_bin)} exit {decompress_status}, tar exit {tar.returncode}): "
+                f"{tar_err.decode(errors='replace').strip()}"
+            )
+
+    def _extract_with_libarchive(self) -> None:
+        """Extract the backup archive in-process with libarchive, refusing unsafe paths"""
+        flags = (
+            libarchive.extract.EXTRACT_SECURE_NODOTDOT
+            | libarchive.extract.EXTRACT_SECURE_NOABSOLUTEPATHS
+            | libarchive.extract.EXTRACT_SECURE_SYMLINKS
+        )
+        # libarchive extracts relative to the working directory. This runs before any
+        # site restore threads are started, so changing it briefly is safe.
+        cwd = os.getcwd()
+        os.chdir(self.temp_dir)
+        try:
+            libarchive.extract_file(str(self.backup_path), flags)
+        finally:
+            os.chdir(cwd)
+
+    @contextmanager
+    def _open_archive(self):
+        """
+        Open the backup archive as a forward-only tar stream
+        
+        Compressed archives are decompressed by an external program (see _decompressor)
+        when one is installed, otherwise the file is read through a 1 MiB buffer. Either
+        way the input is read in 1 MiB chunks.
+        
+        Yields:
+            tarfile.TarFile: Streaming tar reader over the backup
+        """
+        decompressor_bin = self._decompressor()
+        with _open_sequential(self.backup_path) as f:
+            if not decompressor_bin and self.backup_path.suffix == '.zst':
+                if zstandard is None:
+                    raise RuntimeError("Restoring a .zst backup needs zstd on PATH or the zstandard package")
+                with zstandard.ZstdDecompressor().stream_reader(f, closefd=False) as reader:
+                    with tarfile.open(fileobj=reader, mode='r|', bufsize=_TAR_BUFSIZE, copybufsize=_TAR_COPYBUFSIZE) as tar:
+                        yield tar
+                return
+            if not decompressor_bin:
+                with tarfile.open(fileobj=f, mode='r|*', bufsize=_TAR_BUFSIZE, copybufsize=_TAR_COPYBUFSIZE) as tar:
+                    yield tar
+                return
+
+            proc = subprocess.Popen([decompressor_bin, '-d', '-c'], stdin=f, stdout=subprocess.PIPE, bufsize=1 << 20)
+            try:
+                with tarfile.open(fileobj=proc.stdout, mode='r|', bufsize=_TAR_BUFSIZE, copybufsize=_TAR_COPYBUFSIZE) as tar:
+                    yield tar
+                proc.stdout.read()  # Drain the trailing padding so the decompressor exits cleanly
+            finally:
+                proc.stdout.close()
+                returncode = proc.wait()
+        if returncode:
+            raise RuntimeError(
+                f"{os.path.basename(decompressor_bin)} failed to decompress {self.backup_path} (exit status {returncode})"
+            )
+
     def _load_bench_info(self) -> Dict[str, Any]:
         """
         Load bench info from the extracted backup
@@ -69,54 +355,128 @@ class BenchRestorer:
         if not bench_info_path.exists():
             raise ValueError(f"Bench info not found in backup: {bench_info_path}")
         
-        with open(bench_info_path) as f:
-            return json.load(f)
+        return _json.load(bench_info_path)
 
-    def restore_site(self, site_name: str) -> bool:
+    def _decompress_dump(self, dump_path: str, site_name: str) -> Optional[str]:
         """
-        Restore a single site from backup
+        Decompress a gzipped database dump ahead of frappe's restore
+        
+        Uses the fastest gunzip on PATH, rapidgzip decompresses on all cores while pigz
+        and gzip use one core each. The output is a regular file rather than a pipe
+        because frappe reads the dump more than once. It is written under target_dir,
+        next to the bench, rather than in the temp directory the backup was extracted to.
         
         Args:
-            site_name (str): Name of the site to restore
+            dump_path (str): Path to the .sql.gz dump
+            site_name (str): Site the dump belongs to
             
         Returns:
-            bool: True if restore was successful, False otherwise
+            Optional[str]: Path to the decompressed .sql file, or None if no gunzip is available
         """
+        gunzip = _choose_gunzip()
+        if not gunzip:
+            return None
+
+        fd, sql_file = tempfile.mkstemp(prefix=f".{site_name}_", suffix='.sql', dir=self.target_dir)
+        try:
+            with os.fdopen(fd, 'wb') as out:
+                subprocess.run([gunzip, '-dc', dump_path], stdout=out, stderr=subprocess.PIPE, check=True)
+        except (OSError, subprocess.CalledProcessError) as e:
+            os.remove(sql_file)
+            logger.warning("%s could not decompress %s, letting frappe do it: %s", os.path.basename(gunzip), dump_path, e)
+            return None
+        return os.path.abspath(sql_file)
+
+    def _has_root_password(self) -> bool:
+        """Whether frappe can restore without prompting for the database root password"""
+        config_path = self.sites_dir / 'common_site_config.json'
         try:
-            site_dir = self.bench_dir / 'sites' / site_name
-            site_dir.mkdir(parents=True, exist_ok=True)
+            return bool(_json.load(config_path).get('root_password'))
+        except (OSError, ValueError):
+            return False
+
+    def _find_dump(self, site_name: str) -> Optional[str]:
+        """
+        Find a site's newest database dump
+        
+        Args:
+            site_name (str): Name of the site
             
+        Returns:
+            Optional[str]: Path to the .sql.gz dump, or None if the site has no dump
+        """
+        try:
             # Get site backup from sites_backup directory
             backup_site_dir = self.sites_backup_dir / site_name
-            if backup_site_dir.exists():
-                # Find the backup file in the site directory
-                backup_files = list(backup_site_dir.glob('*.sql.gz'))
-                if backup_files:
-                    # Since we know there's only one backup file per site
-                    backup_file = backup_files[0]
-                    self.console.print(f"[cyan]Restoring site {site_name} from {backup_file.name}...[/cyan]")
-                    result = subprocess.run(
-                        ['bench',"--site",site_name,"restore",backup_file],
-                        cwd=self.bench_dir
-                    )
-                    return result.returncode == 0
-                else:
-                    self.console.print(f"[yellow]No backup files found for site {site_name}[/yellow]")
-            else:
-                self.console.print(f"[yellow]No backup directory found for site {site_name}[/yellow]")
-            return False
+            if not backup_site_dir.exists():
+                logger.warning("No backup directory found for site %s", site_name)
+                return None
+            # Find the newest database dump in the site directory in a single pass
+            with os.scandir(backup_site_dir) as entries:
+                backup_file = max(
+                    (entry for entry in entries if entry.name.endswith('.sql.gz')),
+                    key=lambda entry: entry.stat().st_mtime,
+                    default=None
+                )
+            if backup_file is None:
+                logger.warning("No backup files found for site %s", site_name)
+                return None
+            return backup_file.path
+        except Exception as e:
+            logger.error("Error looking up the dump for site %s: %s", site_name, e)
+            return None
+
+    def restore_site(self, site_name: str, dump_path: Optional[str] = None) -> bool:
+        """
+        Restore a single site from backup
+        
+        Args:
+            site_name (str): Name of the site to restore
+            dump_path (str, optional): Result of _find_dump, looked up here when not given
             
-        except SystemExit as e:
-            self.console.print(f"[red]Failed to restore site {site_name}: Command exited with error[/red]")
-            import traceback
-            traceback.print_exc()
+        Returns:
+            bool: True if restore was successful, False otherwise
+        """
+        if dump_path is None:
+            dump_path = self._find_dump(site_name)
+        if dump_path is None:
             return False
+
+        sql_file = None
+        try:
+            site_dir = self.sites_dir / site_name
+            # The same layout frappe's make_site_dirs creates, made up front in one go
+            for subdir in _SITE_SUBDIRS:
+                os.makedirs(site_dir / subdir, exist_ok=True)
+            
+            logger.info("Restoring site %s from %s...", site_name, os.path.basename(dump_path))
+            # Decompressed here rather than up front, so at most one .sql per worker is on disk
+            sql_file = self._decompress_dump(dump_path, site_name)
+            # Run frappe's restore directly in the bench env, skipping the bench CLI startup.
+            # stdout/stderr are inherited so the root password prompt and import errors reach
+            # the terminal. It runs from sites/, the dump paths are absolute for that reason.
+            result = subprocess.run(
+                [
+                    str(self.bench_dir / 'env' / 'bin' / 'python'),
+                    '-m', 'frappe.utils.bench_helper', 'frappe',
+                    '--site', site_name, 'restore', sql_file or dump_path
+                ],
+                cwd=self.sites_dir
+            )
+            if result.returncode:
+                logger.error("Failed to restore site %s: frappe exited with status %s", site_name, result.returncode)
+                return False
+            return True
+            
         except Exception as e:
-            self.console.print(f"[red]Error restoring site {site_name}: {str(e)}[/red]")
+            logger.error("Error restoring site %s: %s", site_name, e)
             return False
+        finally:
+            if sql_file and os.path.exists(sql_file):
+                os.remove(sql_file)
 
     def restore_bench(self, skip_apps: bool = False, skip_sites: bool = False, 
-                     new_name: Optional[str] = None) -> Path:
+                     new_name: Optional[str] = None, parallel: int = 1) -> Path:
         """
         Restore Frappe bench from backup
         
@@ -124,38 +484,73 @@ class BenchRestorer:
             skip_apps (bool, optional): Skip installing apps
             skip_sites (bool, optional): Skip restoring sites
             new_name (str, optional): New name for the restored bench
+            parallel (int, optional): Number of sites to restore concurrently
             
         Returns:
             Path: Path to the restored bench directory
         """
+        succeeded = False
         try:
             # Use new name if provided, otherwise use original name
             bench_name = new_name if new_name else self.bench_info['name']
             self.bench_dir = self.target_dir / bench_name
+            self.sites_dir = self.bench_dir / 'sites'
             
-            # Create bench using the info file
-            self.console.print(f"[cyan]Creating bench at {self.bench_dir}...[/cyan]")
-            create_bench(self.bench_dir, self.extracted_dir / 'bench_info.json', skip_apps)
-            
-            # Restore sites if not skipped
+            # Imported here so loading this module doesn't pull in bench's init machinery
+            from .create import create_bench
+
+            site_names = []
             if not skip_sites:
-                self.sites_backup_dir = self.extracted_dir / 'sites_backup'
+                self.sites_backup_dir = (self.extracted_dir / 'sites_backup').absolute()
                 if self.sites_backup_dir.exists():
-                    for site in self.bench_info['sites']:
-                        self.restore_site(site['name'])
+                    site_names = [site['name'] for site in self.bench_info['sites']]
+
+            # Create bench using the info file
+            self.console.print(f"[cyan]Creating bench at {self.bench_dir}...[/cyan]")
+            create_bench(self.bench_dir, self.bench_info, skip_apps)
+
+            # Restore the sites that have a dump, missing ones were reported by _find_dump
+            dumps = [self._find_dump(site_name) for site_name in site_names]
+            # Each restore mostly waits on the database server, so threads are enough
+            max_workers = max(1, min(parallel, len(site_names)))
+            if max_workers > 1 and not self._has_root_password():
+                # Each frappe restore would prompt for it on the same terminal at the same time
+                self.console.print(
+                    "[yellow]No root_password in common_site_config.json, restoring sites one at a time[/yellow]"
+                )
+                max_workers = 1
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [
+                    executor.submit(self.restore_site, site_name, dump_path)
+                    for site_name, dump_path in zip(site_names, dumps)
+                    if dump_path is not None
+                ]
+                # Judged on the restores that ran, a site without a dump can't be fixed by retrying
+                succeeded = all([future.result() for future in futures])
+
+            missing = [site_name for site_name, dump_path in zip(site_names, dumps) if dump_path is None]
+            if missing:
+                self.console.print(f"[yellow]No database dump in the backup for: {', '.join(missing)}[/yellow]")
 
             return self.bench_dir
             
         finally:
             # Clean up temporary directory if it was created
-            if self.temp_dir and os.path.exists(self.temp_dir):
+            if self.temp_dir is not None and self.resume and not succeeded:
+                self.console.print(
+                    f"[yellow]Keeping extracted backup in {self.temp_dir}, "
+                    f"restore again with --resume to reuse it[/yellow]"
+                )
+            elif self.temp_dir is not None:
                 self.console.print(f"[cyan]Cleaning up temporary directory: {self.temp_dir}[/cyan]")
-                shutil.rmtree(self.temp_dir)
+                # The restored bench is ready, don't make the caller wait on unlinking the extracted tree
+                remove_in_background(self.temp_dir)
                 self.temp_dir = None
                 self.extracted_dir = None
 
 def restore_bench(backup_path: str, target_dir: str, skip_apps: bool = False, 
-                 skip_sites: bool = False, new_name: Optional[str] = None, *args, **kwargs) -> Path:
+                 skip_sites: bool = False, new_name: Optional[str] = None, parallel: int = 1,
+                 *args, resume: bool = False, **kwargs) -> Path:
     """
     Convenience function to restore a bench from backup
     
@@ -165,9 +560,11 @@ def restore_bench(backup_path: str, target_dir: str, skip_apps: bool = False,
         skip_apps (bool, optional): Skip installing apps
         skip_sites (bool, optional): Skip restoring sites
         new_name (str, optional): New name for the restored bench
+        parallel (int, optional): Number of sites to restore concurrently
+        resume (bool, optional): Reuse an extraction kept by an earlier failed restore
         
     Returns:
         Path: Path to the restored bench directory
     """
-    restorer = BenchRestorer(backup_path, target_dir)
-    return restorer.restore_bench(skip_apps, skip_sites, new_name, *args, **kwargs)
+    restorer = BenchRestorer(backup_path, target_dir, resume)
+    return restorer.restore_bench(skip_apps, skip_sites, new_name, parallel, *args, **kwargs)
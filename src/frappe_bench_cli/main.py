@@ -5,7 +5,6 @@ FBM (Frappe Bench Manager) - Main module for programmatic usage and CLI entrypoi
 from .cli import cli
 from .commands.backup import backup_bench
 from .commands.restore import restore_bench
-from .commands.create import create_bench
 
 # Programmatic API
 
@@ -61,6 +60,7 @@ def create(bench_path, info_file=None):
     Returns:
         str: Path to the created bench
     """
+    from .commands.create import create_bench
     return create_bench(
         bench_path=bench_path,
         info_file=info_file